@@ -7,7 +7,7 @@
     let
       system = "aarch64-darwin";
       pkgs = nixpkgs.legacyPackages.${system};
-      python = pkgs.python3.withPackages (ps: [ ps.rich ]);
+      python = pkgs.python3.withPackages (ps: [ ps.rich ps.orjson ]);
     in {
       packages.${system}.default = pkgs.writeShellApplication {
         name = "transcribe";
@@ -15,49 +15,81 @@ Usage:
 """
 
 import argparse
-import json
+import functools
+import io
+import operator
+import os
 import re
+import signal
 import subprocess
 import sys
 import tempfile
-from datetime import datetime
+from array import array
+from collections.abc import Callable
 from pathlib import Path
 
-from rich.console import Console
-
-console = Console()
-err_console = Console(stderr=True)
-
 # Paragraph break threshold (seconds of silence between segments)
 PARAGRAPH_GAP_SECONDS = 1.5
 
+# ffmpeg output options for Parakeet's native input: 16kHz mono, so it never resamples
+MODEL_AUDIO_ARGS = ["-ar", "16000", "-ac", "1"]
+
 AUDIO_EXTENSIONS = {'.opus', '.mp3', '.wav', '.m4a', '.ogg', '.flac', '.aac', '.wma', '.webm'}
 
 
-def _format_time(seconds: float, brackets: bool = False) -> str:
-    """Convert seconds to MM:SS or HH:MM:SS format."""
-    total = int(seconds)
-    h, m, s = total // 3600, (total % 3600) // 60, total % 60
-    time_str = f"{h}:{m:02d}:{s:02d}" if h > 0 else f"{m}:{s:02d}"
-    return f"[{time_str}]" if brackets else time_str
+class _RX:
+    """Every regex the script uses, compiled once at import. Add new ones here."""
+    # Host must be youtube.com/youtu.be or a subdomain (www., m., music.)
+    yt = re.compile(r'^(?:https?://)?(?:[\w-]+\.)*(?:youtube\.com/(?:watch\?v=|embed/|v/)|youtu\.be/)')
+    yt_id = re.compile(r'(?:[?&]v=|youtu\.be/|/embed/|/v/)([\w-]{11})')
+    # One SRT cue: "HH:MM:SS,mmm --> HH:MM:SS,mmm" line, then text up to a blank line
+    srt = re.compile(
+        r'(\d+):(\d+):(\d+)[,.](\d+)[ \t]*-->[ \t]*(\d+):(\d+):(\d+)[,.](\d+)[ \t]*(?=\r?\n)'
+        r'(.*?)(?=\n\s*\n|\Z)',
+        re.S,
+    )
+
+
+_UNSAFE_TABLE = str.maketrans('', '', '<>:"/\\|?*')
+
+# Zero-padded minute/second fields, indexed 0-59
+_SS = [f"{i:02d}" for i in range(60)]
+
+# YouTube transcriptions are cached here as <video id>.json
+CACHE_DIR = Path.home() / ".cache" / "transcribe"
+
+
+@functools.cache
+def get_console(stderr: bool = False):
+    # rich is imported on first use so --help and early exits stay fast
+    from rich.console import Console
+    return Console(stderr=stderr)
 
 
-def format_timestamp(seconds: float) -> str:
-    return _format_time(seconds, brackets=True)
+# Segments often share a whole-second start, and there are only so many seconds
+@functools.cache
+def _fmt_ts_bracket(total: int) -> str:
+    """Convert whole seconds to [MM:SS] or [HH:MM:SS] format."""
+    h, rem = divmod(total, 3600)
+    m, s = divmod(rem, 60)
+    return f"[{h}:{_SS[m]}:{_SS[s]}]" if h else f"[{m}:{_SS[s]}]"
 
 
-def format_duration(seconds: float) -> str:
-    return _format_time(seconds, brackets=False)
+def _fmt_duration(seconds: float) -> str:
+    """Convert seconds to MM:SS or HH:MM:SS format."""
+    h, rem = divmod(int(seconds), 3600)
+    m, s = divmod(rem, 60)
+    return f"{h}:{_SS[m]}:{_SS[s]}" if h else f"{m}:{_SS[s]}"
 
 
 def is_youtube_url(url: str) -> bool:
-    patterns = [
-        r'youtube\.com/watch\?v=',
-        r'youtu\.be/',
-        r'youtube\.com/embed/',
-        r'youtube\.com/v/',
-    ]
-    return any(re.search(p, url) for p in patterns)
+    # Cheap substring check first; most inputs are file paths
+    return 'youtu' in url and _RX.yt.search(url) is not None
+
+
+def youtube_video_id(url: str) -> str | None:
+    match = _RX.yt_id.search(url)
+    return match.group(1) if match else None
 
 
 def is_audio_file(path: Path) -> bool:
@@ -68,38 +100,71 @@ def collect_audio_files(path: Path, recursive: bool = False) -> list[Path]:
     if path.is_file():
         if is_audio_file(path):
             return [path]
-        console.print(f"[yellow]Skipping non-audio file:[/yellow] {path}")
+        get_console().print(f"[yellow]Skipping non-audio file:[/yellow] {path}")
         return []
     elif path.is_dir():
         if recursive:
             return sorted(f for f in path.rglob('*') if is_audio_file(f))
         return sorted(f for f in path.iterdir() if is_audio_file(f))
-    console.print(f"[red]Not found:[/red] {path}")
+    get_console().print(f"[red]Not found:[/red] {path}")
     return []
 
 
 def sanitize_filename(title: str, kebab: bool = False) -> str:
-    safe = re.sub(r'[<>:"/\\|?*]', '', title).strip()
+    safe = title.translate(_UNSAFE_TABLE).strip()
     if kebab:
-        safe = re.sub(r'\s+', '-', safe.lower())
+        safe = '-'.join(safe.lower().split())
     return safe[:80]
 
 
-def get_video_info(url: str) -> dict:
+def _json_loads(data: bytes):
+    # orjson is optional; it parses yt-dlp's large metadata dumps several times faster
+    try:
+        from orjson import loads
+    except ImportError:
+        from json import loads
+    return loads(data)
+
+
+def get_video_info(url: str, verbose: bool = False) -> dict:
     print("Fetching video info...")
+    # Only the fields we use; --dump-json serializes every format and thumbnail
+    fields = ["--dump-json"] if verbose else ["--print", "%(title)s\t%(duration)s\t%(id)s"]
     cmd = [
         "yt-dlp",
         "--cookies-from-browser", "chrome",
         "--no-check-formats",
-        "--dump-json",
+        "--no-playlist",
+        *fields,
         "--no-download",
         url
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    # Runs in a worker thread, so failures are raised for the caller to report
+    result = subprocess.run(cmd, capture_output=True)
     if result.returncode != 0:
-        print(f"Error getting video info: {result.stderr}", file=sys.stderr)
-        sys.exit(1)
-    return json.loads(result.stdout)
+        raise RuntimeError(f"Error getting video info: {result.stderr.decode(errors='replace').strip()}")
+
+    if verbose:
+        # Show the full dump for debugging, then keep the same fields as --print
+        sys.stderr.flush()
+        sys.stderr.buffer.write(result.stdout)
+        sys.stderr.flush()
+        try:
+            info = _json_loads(result.stdout)
+            title, duration, video_id = info.get("title") or "video", info.get("duration"), info.get("id")
+        except (ValueError, AttributeError):
+            raise RuntimeError("Unexpected yt-dlp --dump-json output (see above)") from None
+    else:
+        try:
+            title, duration, video_id = result.stdout.decode(errors='replace').rstrip('\n').rsplit('\t', 2)
+        except ValueError:
+            raise RuntimeError(f"Unexpected yt-dlp output: {result.stdout!r}") from None
+
+    try:
+        seconds = float(duration)
+    except (TypeError, ValueError):  # null / "NA" for livestreams and some extractors
+        seconds = 0
+    return {"title": title, "duration": seconds, "id": video_id}
 
 
 def get_audio_duration(path: Path) -> float:
@@ -122,11 +187,10 @@ def convert_to_wav(input_path: Path, output_dir: Path) -> Path:
     if input_path.suffix.lower() == '.wav':
         return input_path
     wav_path = output_dir / f"{input_path.stem}.wav"
-    console.print(f"  Converting {input_path.suffix} to wav...")
+    get_console().print(f"  Converting {input_path.suffix} to wav...")
     cmd = [
         "ffmpeg", "-i", str(input_path),
-        "-ar", "16000",  # 16kHz (optimal for speech recognition)
-        "-ac", "1",      # mono
+        *MODEL_AUDIO_ARGS,
         "-y",
         str(wav_path)
     ]
@@ -136,54 +200,84 @@ def convert_to_wav(input_path: Path, output_dir: Path) -> Path:
     return wav_path
 
 
-def download_audio(url: str, output_path: Path) -> None:
+def download_audio(
+    url: str,
+    output_path: Path,
+    abort: Callable[[], BaseException | None] | None = None,
+) -> None:
+    """Download and decode url's audio; polls abort and raises what it returns."""
     print("Downloading audio...")
-    cmd = [
+    ytdlp_cmd = [
         "yt-dlp",
         "--cookies-from-browser", "chrome",
         "--no-check-formats",
-        "-x",
-        "--audio-format", "wav",
-        "--audio-quality", "0",
-        "-o", str(output_path),
+        "--no-playlist",
+        "-f", "bestaudio/best",
+        "-o", "-",
         "--progress",
         "--no-warnings",
         url
     ]
-    result = subprocess.run(cmd)
-    if result.returncode != 0:
+    # Decode straight from the download stream so only the final 16kHz mono
+    # wav is written, instead of a full-rate wav that Parakeet resamples
+    ffmpeg_cmd = [
+        "ffmpeg", "-v", "error", "-nostats",
+        "-i", "pipe:0",
+        "-vn",
+        *MODEL_AUDIO_ARGS,
+        "-y",
+        str(output_path)
+    ]
+    ytdlp = subprocess.Popen(ytdlp_cmd, stdout=subprocess.PIPE)
+    ffmpeg = subprocess.Popen(ffmpeg_cmd, stdin=ytdlp.stdout, stderr=subprocess.PIPE, text=True)
+    ytdlp.stdout.close()  # let yt-dlp see a broken pipe if ffmpeg exits early
+    while True:
+        try:
+            _, ffmpeg_err = ffmpeg.communicate(timeout=0.5)
+            break
+        except subprocess.TimeoutExpired:
+            error = abort() if abort is not None else None
+            if error is not None:
+                ytdlp.kill()
+                ffmpeg.kill()
+                ytdlp.wait()
+                ffmpeg.wait()
+                raise error
+
+    # A failed ffmpeg takes yt-dlp down with a broken pipe, and yt-dlp's exit
+    # code can't tell that apart from its own errors, so ffmpeg's result wins
+    if ffmpeg.returncode != 0:
+        if ytdlp.poll() is None:
+            ytdlp.terminate()
+        ytdlp.wait()
+        message = f"ffmpeg failed: {ffmpeg_err.strip()}"
+        if ytdlp.returncode not in (0, -signal.SIGPIPE, -signal.SIGTERM):
+            message += f" (yt-dlp also exited with status {ytdlp.returncode}; see its output above)"
+        raise RuntimeError(message)
+
+    ytdlp.wait()
+    if ytdlp.returncode != 0:
         print("Error downloading audio", file=sys.stderr)
         print("Tip: Try running with browser cookies: yt-dlp --cookies-from-browser chrome ...", file=sys.stderr)
         sys.exit(1)
 
 
-def parse_srt_timestamp(timestamp: str) -> float:
-    time_part, ms_part = timestamp.split(',')
-    h, m, s = time_part.split(':')
-    return int(h) * 3600 + int(m) * 60 + int(s) + int(ms_part) / 1000
-
-
-def parse_srt(content: str) -> list:
-    segments = []
-    blocks = content.strip().split('\n\n')
-    for block in blocks:
-        lines = block.strip().split('\n')
-        if len(lines) >= 3:
-            try:
-                timestamp_line = lines[1]
-                start_ts, end_ts = timestamp_line.split(' --> ')
-                start = parse_srt_timestamp(start_ts.strip())
-                end = parse_srt_timestamp(end_ts.strip())
-                text = ' '.join(lines[2:]).strip()
-                if text:
-                    segments.append({'start': start, 'end': end, 'text': text})
-            except (ValueError, IndexError):
-                continue
-    return segments
+def parse_srt(content: str) -> dict:
+    """Parse SRT cues into parallel starts/ends arrays and a texts list."""
+    starts = array('d')
+    ends = array('d')
+    texts = []
+    for match in _RX.srt.finditer(content):
+        h1, m1, s1, ms1, h2, m2, s2, ms2, body = match.groups()
+        text = ' '.join(body.splitlines()).strip()
+        if text:
+            starts.append(int(h1) * 3600 + int(m1) * 60 + int(s1) + int(ms1) / 1000)
+            ends.append(int(h2) * 3600 + int(m2) * 60 + int(s2) + int(ms2) / 1000)
+            texts.append(text)
+    return {"starts": starts, "ends": ends, "texts": texts}
 
 
 def transcribe_audio(audio_path: Path) -> dict:
-    import threading
     from rich.live import Live
     from rich.text import Text
 
@@ -194,40 +288,142 @@ def transcribe_audio(audio_path: Path) -> dict:
         "--output-dir", str(audio_path.parent),
     ]
 
-    result = None
-    def run_transcription():
-        nonlocal result
-        result = subprocess.run(cmd, capture_output=True, text=True)
+    # stderr goes to a file, not a pipe, since nothing drains a pipe while we wait;
+    # stdout is only progress output and is never reported
+    with tempfile.TemporaryFile() as log:
+        proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=log)
+
+        if sys.stdout.isatty():
+            marquee_text = "TRANSCRIBING \u2022 "
+            width = 24
+            marquee_buf = marquee_text * (width // len(marquee_text) + 2)
+            pos = 0
+
+            with Live(Text(""), refresh_per_second=2, transient=True) as live:
+                while proc.poll() is None:
+                    live.update(Text(marquee_buf[pos:pos + width], style="bold blue"))
+                    pos = (pos - 1) % len(marquee_text)
+                    try:
+                        proc.wait(timeout=0.5)
+                    except subprocess.TimeoutExpired:
+                        pass
+        else:
+            print("Transcribing...")
+        proc.wait()
 
-    thread = threading.Thread(target=run_transcription)
-    thread.start()
+        if proc.returncode != 0:
+            log.seek(0)
+            stderr = log.read().decode(errors='replace').strip()
+            raise RuntimeError(f"parakeet-mlx failed: {stderr}")
 
-    marquee_text = "TRANSCRIBING \u2022 "
-    width = 24
-    pos = 0
+    # parakeet-mlx names its output after the input stem
+    srt_path = audio_path.with_suffix(".srt")
+    try:
+        content = srt_path.read_text()
+    except FileNotFoundError:
+        srt_files = sorted(audio_path.parent.glob("*.srt"))
+        if not srt_files:
+            if os.getenv("TRANSCRIBE_DEBUG"):
+                listing = ", ".join(f.name for f in audio_path.parent.iterdir())
+                raise RuntimeError(f"No SRT output found (dir contains: {listing})")
+            raise RuntimeError("No SRT output found (set TRANSCRIBE_DEBUG=1 to list the output dir)")
+        srt_path = srt_files[0]
+        content = srt_path.read_text()
+    transcription = parse_srt(content)
 
-    with Live(Text(""), refresh_per_second=10, transient=True) as live:
-        while thread.is_alive():
-            display = (marquee_text * 3)[pos:pos + width]
-            live.update(Text(display, style="bold blue"))
-            pos = (pos - 1) % len(marquee_text)
-            thread.join(timeout=0.1)
+    # Clean up so subsequent transcriptions in same dir don't collide
+    srt_path.unlink()
+
+    return transcription
+
+
+@functools.cache
+def _parakeet_version() -> str:
+    """Identify the parakeet-mlx install on PATH, which lives outside this interpreter."""
+    import shutil
+
+    exe = shutil.which("parakeet-mlx")
+    if exe is None:
+        return "unknown"
+    exe_path = Path(exe).resolve()
+    # pipx/venv layout: <venv>/bin/parakeet-mlx beside <venv>/lib/pythonX.Y/site-packages
+    # glob order is arbitrary; if stale dist-info dirs linger, the newest is the live one
+    dists = exe_path.parent.parent.glob("lib/python*/site-packages/parakeet_mlx-*.dist-info")
+    dist = max(dists, key=lambda d: (d.stat().st_mtime_ns, d.name), default=None)
+    if dist is not None:
+        return dist.name.removeprefix("parakeet_mlx-").removesuffix(".dist-info")
+    # Unknown layout: any reinstall rewrites the entry point, so its mtime still changes
+    try:
+        return f"{exe_path}@{exe_path.stat().st_mtime_ns}"
+    except OSError:
+        return "unknown"
 
-    if result.returncode != 0:
-        raise RuntimeError(f"parakeet-mlx failed: {result.stderr.strip()}")
 
-    srt_files = list(audio_path.parent.glob("*.srt"))
-    if not srt_files:
-        listing = ", ".join(f.name for f in audio_path.parent.iterdir())
-        raise RuntimeError(f"No SRT output found (dir contains: {listing})")
+def load_cached_transcription(video_id: str) -> dict | None:
+    cache_path = CACHE_DIR / f"{video_id}.json"
+    try:
+        data = _json_loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    # Results from a different Parakeet release may differ, so treat as a miss
+    if data.get("parakeet_version") != _parakeet_version():
+        return None
+    try:
+        return {
+            "starts": array('d', data["starts"]),
+            "ends": array('d', data["ends"]),
+            "texts": data["texts"],
+        }
+    except (KeyError, TypeError):
+        return None
+
 
-    content = srt_files[0].read_text()
-    segments = parse_srt(content)
+def save_cached_transcription(video_id: str, transcription: dict) -> None:
+    import json
 
-    # Clean up so subsequent transcriptions in same dir don't collide
-    srt_files[0].unlink()
+    data = {
+        "parakeet_version": _parakeet_version(),
+        "starts": transcription["starts"].tolist(),
+        "ends": transcription["ends"].tolist(),
+        "texts": transcription["texts"],
+    }
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write beside the entry and rename over it, so an interrupted or concurrent
+        # run never leaves a truncated file behind
+        fd, tmp_name = tempfile.mkstemp(dir=CACHE_DIR, prefix=f".{video_id}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(json.dumps(data))
+            os.replace(tmp_name, CACHE_DIR / f"{video_id}.json")
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError as e:
+        get_console(stderr=True).print(f"[yellow]Could not write cache:[/yellow] {e}")
+
+
+def _transcript_body(transcription: dict, include_timestamps: bool):
+    """Yield the transcript section one segment or paragraph at a time."""
+    starts = transcription["starts"]
+    ends = transcription["ends"]
+    texts = transcription["texts"]
 
-    return {"segments": segments}
+    if include_timestamps:
+        # int() and the cached formatter both run inside map, off the bytecode loop
+        stamps = map(_fmt_ts_bracket, map(int, starts))
+        for stamp, text in zip(stamps, texts):
+            yield f"\n{stamp} {text}\n"
+    elif texts:
+        # Paragraphs start wherever the silence before a segment exceeds the gap
+        gaps = map(operator.sub, starts[1:], ends)
+        breaks = [i for i, gap in enumerate(gaps, 1) if gap > PARAGRAPH_GAP_SECONDS]
+
+        bounds = [0, *breaks, len(texts)]
+        for lo, hi in zip(bounds, bounds[1:]):
+            yield f"\n{' '.join(texts[lo:hi])}\n"
 
 
 def generate_markdown(
@@ -237,55 +433,29 @@ def generate_markdown(
     transcription: dict,
     include_timestamps: bool,
 ) -> str:
-    lines = [
-        f"# Transcript: {title}",
-        "",
-        f"**Source:** {source}",
-        f"**Duration:** {format_duration(duration)}",
-        f"**Transcribed:** {datetime.now().strftime('%Y-%m-%d')}",
-        "",
-        "---",
-        "",
-        "## Transcript",
-        "",
-    ]
-
-    segments = transcription.get("segments", [])
-
-    if include_timestamps:
-        for segment in segments:
-            start = segment.get("start", 0)
-            text = segment.get("text", "").strip()
-            if text:
-                lines.append(f"{format_timestamp(start)} {text}")
-                lines.append("")
-    else:
-        paragraphs = []
-        current_para = []
-        last_end = 0
-
-        for segment in segments:
-            start = segment.get("start", 0)
-            end = segment.get("end", start)
-            text = segment.get("text", "").strip()
-            if not text:
-                continue
-
-            if current_para and (start - last_end) > PARAGRAPH_GAP_SECONDS:
-                paragraphs.append(' '.join(current_para))
-                current_para = []
-
-            current_para.append(text)
-            last_end = end
-
-        if current_para:
-            paragraphs.append(' '.join(current_para))
-
-        for para in paragraphs:
-            lines.append(para)
-            lines.append("")
-
-    return "\n".join(lines)
+    from datetime import datetime
+
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# Transcript: {title}\n\n")
+    w(f"**Source:** {source}\n")
+    w(f"**Duration:** {_fmt_duration(duration)}\n")
+    w(f"**Transcribed:** {datetime.now().strftime('%Y-%m-%d')}\n\n")
+    w("---\n\n## Transcript\n")
+    # Consumed lazily, so no per-segment list is ever built or regrown
+    buf.writelines(_transcript_body(transcription, include_timestamps))
+    return buf.getvalue()
+
+
+def write_output(path: Path, text: str) -> None:
+    # Encode once and hand the bytes to the kernel directly, no text-file buffering
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
 
 def _handle_existing_file(output_path: Path) -> Path | None:
@@ -312,7 +482,7 @@ def _handle_existing_file(output_path: Path) -> Path | None:
 
 
 def transcribe_file(file_path: Path, output_path: Path, include_timestamps: bool) -> bool:
-    console.print(f"\n[bold]Transcribing:[/bold] {file_path.name}")
+    get_console().print(f"\n[bold]Transcribing:[/bold] {file_path.name}")
     try:
         duration = get_audio_duration(file_path)
 
@@ -328,42 +498,77 @@ def transcribe_file(file_path: Path, output_path: Path, include_timestamps: bool
             include_timestamps=include_timestamps,
         )
 
-        output_path.write_text(markdown)
-        console.print(f"[green]\u2713[/green] Saved to: {output_path}")
+        write_output(output_path, markdown)
+        get_console().print(f"[green]\u2713[/green] Saved to: {output_path}")
         return True
     except RuntimeError as e:
-        err_console.print(f"[red]Failed:[/red] {file_path.name}: {e}")
+        get_console(stderr=True).print(f"[red]Failed:[/red] {file_path.name}: {e}")
         return False
 
 
-def transcribe_youtube(url: str, args) -> bool:
-    video_info = get_video_info(url)
-    title = video_info.get("title", "video")
-    duration = video_info.get("duration", 0)
+def _youtube_output_path(title: str, args) -> Path:
+    if args.output:
+        return Path(args.output)
+    safe_title = sanitize_filename(title, kebab=args.kebab)
+    suffix = "-transcript.md" if args.kebab else " Transcript.md"
+    return Path(f"{safe_title}{suffix}")
 
+
+def _failed(future) -> BaseException | None:
+    return future.exception() if future.done() else None
+
+
+def transcribe_youtube(url: str, args) -> bool | None:
+    """Transcribe one video; returns None if the user cancels at the overwrite prompt."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    # An explicit -o path is known up front, so resolve conflicts before any work
+    output_path = None
     if args.output:
-        output_path = Path(args.output)
-    else:
-        safe_title = sanitize_filename(title, kebab=args.kebab)
-        suffix = "-transcript.md" if args.kebab else " Transcript.md"
-        output_path = Path(f"{safe_title}{suffix}")
+        output_path = _youtube_output_path("", args)
+        if output_path.exists() and not args.force:
+            output_path = _handle_existing_file(output_path)
+            if output_path is None:
+                return None
+
+    # Keyed by the video ID in the URL so &t=, playlist params etc. still hit
+    video_id = youtube_video_id(url)
+    transcription = None
+    if video_id and not args.no_cache:
+        transcription = load_cached_transcription(video_id)
+
+    # Metadata is only needed for the title/duration, so fetch it while the
+    # audio downloads and transcribes instead of before
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        info_future = pool.submit(get_video_info, url, verbose=args.verbose)
 
-    if output_path.exists() and not args.force:
-        output_path = _handle_existing_file(output_path)
-        if output_path is None:
+        try:
+            if transcription is not None:
+                get_console().print("Using cached transcription")
+            else:
+                with tempfile.TemporaryDirectory() as tmpdir:
+                    audio_path = Path(tmpdir) / "audio.wav"
+                    # Stop downloading as soon as the metadata fetch is known to have failed
+                    download_audio(url, audio_path, abort=lambda: _failed(info_future))
+                    # Don't spend a Parakeet run on a video whose metadata fetch failed
+                    info_future.result()
+                    transcription = transcribe_audio(audio_path)
+                if video_id:
+                    save_cached_transcription(video_id, transcription)
+            video_info = info_future.result()
+        except RuntimeError as e:
+            get_console(stderr=True).print(f"[red]Transcription failed:[/red] {e}")
             return False
 
-    try:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            audio_path = Path(tmpdir) / "audio.wav"
-            download_audio(url, audio_path)
-            wav_files = list(Path(tmpdir).glob("*.wav"))
-            if wav_files:
-                audio_path = wav_files[0]
-            transcription = transcribe_audio(audio_path)
-    except RuntimeError as e:
-        err_console.print(f"[red]Transcription failed:[/red] {e}")
-        return False
+    title = video_info.get("title", "video")
+    duration = video_info.get("duration", 0)
+
+    if output_path is None:
+        output_path = _youtube_output_path(title, args)
+        if output_path.exists() and not args.force:
+            output_path = _handle_existing_file(output_path)
+            if output_path is None:
+                return None
 
     markdown = generate_markdown(
         title=title,
@@ -373,8 +578,8 @@ def transcribe_youtube(url: str, args) -> bool:
         include_timestamps=args.timestamps,
     )
 
-    output_path.write_text(markdown)
-    console.print(f"\n[green]\u2713[/green] Saved to: {output_path}")
+    write_output(output_path, markdown)
+    get_console().print(f"\n[green]\u2713[/green] Saved to: {output_path}")
     return True
 
 
@@ -423,6 +628,16 @@ supported formats: .opus .mp3 .wav .m4a .ogg .flac .aac .wma .webm"""
         action="store_true",
         help="Recursively scan directories for audio files"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-transcribe YouTube videos even if a cached transcript exists"
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Print yt-dlp's full metadata (--dump-json) to stderr for debugging"
+    )
 
     args = parser.parse_args()
 
@@ -439,14 +654,14 @@ supported formats: .opus .mp3 .wav .m4a .ogg .flac .aac .wma .webm"""
 
     total = len(audio_files) + len(youtube_urls)
     if total == 0:
-        console.print("[red]No audio files or YouTube URLs found.[/red]")
+        get_console().print("[red]No audio files or YouTube URLs found.[/red]")
         sys.exit(1)
 
     # Confirm when processing multiple files from directory scan
     if len(audio_files) > 1 and not args.force:
-        console.print(f"\n[bold]Found {len(audio_files)} audio files:[/bold]")
+        get_console().print(f"\n[bold]Found {len(audio_files)} audio files:[/bold]")
         for f in audio_files:
-            console.print(f"  {f}")
+            get_console().print(f"  {f}")
         confirm = input(f"\nTranscribe all {len(audio_files)} files? [y/N]: ").strip().lower()
         if confirm not in ('y', 'yes'):
             print("Cancelled.")
@@ -459,8 +674,10 @@ supported formats: .opus .mp3 .wav .m4a .ogg .flac .aac .wma .webm"""
         output_dir.mkdir(parents=True, exist_ok=True)
 
     # Process YouTube URLs
+    youtube_failed = 0
     for url in youtube_urls:
-        transcribe_youtube(url, args)
+        if transcribe_youtube(url, args) is False:
+            youtube_failed += 1
 
     # Process audio files
     succeeded = 0
@@ -482,7 +699,10 @@ supported formats: .opus .mp3 .wav .m4a .ogg .flac .aac .wma .webm"""
             succeeded += 1
 
     if len(audio_files) > 1:
-        console.print(f"\n[bold green]Done:[/bold green] {succeeded}/{len(audio_files)} files transcribed")
+        get_console().print(f"\n[bold green]Done:[/bold green] {succeeded}/{len(audio_files)} files transcribed")
+
+    if youtube_failed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":